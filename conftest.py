@@ -0,0 +1,39 @@
+"""Shared pytest configuration for SpecOps."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the project root importable once for every test module
+PROJECT_ROOT = str(Path(__file__).resolve().parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from tests._llm_cache import cache_enabled, cached_generate
+
+
+@pytest.fixture(scope="session", autouse=True)
+def llm_response_cache():
+    """Cache real AI provider responses on disk when SPECOPS_TEST_CACHE=1."""
+    if not cache_enabled():
+        yield
+        return
+
+    from src.ai.providers import PROVIDERS
+
+    with pytest.MonkeyPatch.context() as mp:
+        for name, provider_class in PROVIDERS.items():
+            # The mock provider is deterministic and local already
+            if name == "mock":
+                continue
+            mp.setattr(provider_class, "generate", cached_generate(provider_class.generate))
+        yield
+
+
+@pytest.fixture(scope="session")
+def sample_analysis():
+    """A minimal repository analysis shared by the AI engine tests."""
+    from tests.fixtures.sample_analysis import make_sample_analysis
+
+    return make_sample_analysis()
@@ -622,6 +622,16 @@ PROVIDERS = {
     "mock": MockProvider
 }
 
+# Environment variables holding each provider's API key
+PROVIDER_ENV_KEYS = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "google": "GOOGLE_AI_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+    "groq": "GROQ_API_KEY",
+    "ibm_watson": "IBM_WATSON_API_KEY"
+}
+
 
 def get_provider(provider_name: str, api_key: str = None, model: str = None, **kwargs) -> AIProvider:
     """Get an AI provider instance."""
@@ -632,15 +642,7 @@ def get_provider(provider_name: str, api_key: str = None, model: str = None, **k
     
     # Use environment variables as fallback
     if not api_key:
-        env_keys = {
-            "openai": "OPENAI_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY", 
-            "google": "GOOGLE_AI_API_KEY",
-            "openrouter": "OPENROUTER_API_KEY",
-            "groq": "GROQ_API_KEY",
-            "ibm_watson": "IBM_WATSON_API_KEY"
-        }
-        api_key = os.getenv(env_keys.get(provider_name, ""))
+        api_key = os.getenv(PROVIDER_ENV_KEYS.get(provider_name, ""))
     
     # Use default model if not specified
     if not model:
@@ -1,11 +1,17 @@
 """Utility functions for style validation and compliance checking."""
 
+import io
+import mmap
+import os
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 from .style_processor import StyleProcessor, StyleValidationResult
 from ..models import StyleConfig
 
+# Python files larger than this are validated from a memory map
+_MMAP_THRESHOLD = 256 * 1024
+
 
 def validate_file_style(file_path: str, style_config: Optional[StyleConfig] = None) -> StyleValidationResult:
     """Validate a single file against all applicable style guidelines.
@@ -19,7 +25,22 @@ def validate_file_style(file_path: str, style_config: Optional[StyleConfig] = No
     """
     processor = StyleProcessor(style_config)
     
+    # Determine content type based on file extension
+    path = Path(file_path)
+    if path.suffix == '.py':
+        content_type = 'python'
+    elif path.suffix in ['.md', '.markdown']:
+        content_type = 'markdown'
+    else:
+        content_type = 'text'
+    
     try:
+        if content_type == 'python' and os.path.getsize(file_path) > _MMAP_THRESHOLD:
+            # Scan large sources straight from the page cache rather than
+            # decoding a full copy of the file
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return processor.validate_python_buffer(mm, file_path)
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
     except (FileNotFoundError, IOError) as e:
@@ -35,15 +56,6 @@ def validate_file_style(file_path: str, style_config: Optional[StyleConfig] = No
             )]
         )
     
-    # Determine content type based on file extension
-    path = Path(file_path)
-    if path.suffix == '.py':
-        content_type = 'python'
-    elif path.suffix in ['.md', '.markdown']:
-        content_type = 'markdown'
-    else:
-        content_type = 'text'
-    
     return processor.validate_all_styles(content, content_type, file_path)
 
 
@@ -99,13 +111,11 @@ def generate_style_report(
     Returns:
         Formatted report string
     """
-    processor = StyleProcessor()
+    buf = io.StringIO()
+    w = buf.write
     
-    report_lines = [
-        "📋 Style Validation Report",
-        "=" * 50,
-        ""
-    ]
+    w("📋 Style Validation Report\n")
+    w("=" * 50 + "\n\n")
     
     # Summary statistics
     total_files = len(validation_results)
@@ -113,14 +123,11 @@ def generate_style_report(
     non_compliant_files = total_files - compliant_files
     total_violations = sum(len(result.violations) for result in validation_results.values())
     
-    report_lines.extend([
-        f"📊 Summary:",
-        f"  • Total files checked: {total_files}",
-        f"  • Compliant files: {compliant_files}",
-        f"  • Non-compliant files: {non_compliant_files}",
-        f"  • Total violations: {total_violations}",
-        ""
-    ])
+    w("📊 Summary:\n")
+    w(f"  • Total files checked: {total_files}\n")
+    w(f"  • Compliant files: {compliant_files}\n")
+    w(f"  • Non-compliant files: {non_compliant_files}\n")
+    w(f"  • Total violations: {total_violations}\n\n")
     
     # Group violations by severity
     all_violations = []
@@ -139,14 +146,14 @@ def generate_style_report(
         ('Info', info, 'ℹ️')
     ]:
         if items:
-            report_lines.append(f"{emoji} {severity} ({len(items)}):")
+            w(f"{emoji} {severity} ({len(items)}):\n")
             for file_path, violation in items:
                 line_info = f" (line {violation.line_number})" if violation.line_number else ""
-                report_lines.append(f"  📁 {file_path}{line_info}")
-                report_lines.append(f"     • {violation.rule}: {violation.description}")
+                w(f"  📁 {file_path}{line_info}\n")
+                w(f"     • {violation.rule}: {violation.description}\n")
                 if violation.suggestion:
-                    report_lines.append(f"     💡 {violation.suggestion}")
-            report_lines.append("")
+                    w(f"     💡 {violation.suggestion}\n")
+            w("\n")
     
     # List compliant files if requested
     if include_compliant:
@@ -155,29 +162,22 @@ def generate_style_report(
             if result.is_compliant and not result.violations
         ]
         if compliant_files_list:
-            report_lines.extend([
-                "✅ Fully Compliant Files:",
-                *[f"  📁 {file_path}" for file_path in compliant_files_list],
-                ""
-            ])
+            w("✅ Fully Compliant Files:\n")
+            for file_path in compliant_files_list:
+                w(f"  📁 {file_path}\n")
+            w("\n")
     
     # Recommendations
     if non_compliant_files > 0:
-        report_lines.extend([
-            "🔧 Recommendations:",
-            "  • Fix error-level violations first (they prevent compliance)",
-            "  • Address warnings to improve code quality",
-            "  • Consider info-level suggestions for best practices",
-            "  • Use automatic style corrections where available",
-            ""
-        ])
+        w("🔧 Recommendations:\n")
+        w("  • Fix error-level violations first (they prevent compliance)\n")
+        w("  • Address warnings to improve code quality\n")
+        w("  • Consider info-level suggestions for best practices\n")
+        w("  • Use automatic style corrections where available\n")
     else:
-        report_lines.extend([
-            "🎉 All files are compliant with style guidelines!",
-            ""
-        ])
+        w("🎉 All files are compliant with style guidelines!\n")
     
-    return "\n".join(report_lines)
+    return buf.getvalue()
 
 
 def apply_automatic_corrections(
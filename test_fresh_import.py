@@ -1,18 +1,17 @@
 #!/usr/bin/env python3
 """Fresh import test."""
 
+import importlib
 import sys
-import os
 
-# Clear all modules related to task_generator
-modules_to_clear = [k for k in sys.modules.keys() if 'task_generator' in k]
-for module in modules_to_clear:
-    del sys.modules[module]
+_TASK_GENERATOR = 'src.generators.task_generator'
 
-# Add current directory to path
-sys.path.insert(0, os.getcwd())
+# If the module is already loaded, re-execute its body so we see the current
+# source without dropping and re-importing the rest of the package; a fresh
+# interpreter imports it only once
+if _TASK_GENERATOR in sys.modules:
+    importlib.reload(sys.modules[_TASK_GENERATOR])
 
-# Import fresh
 from src.generators.task_generator import TaskGenerator
 
 print(f"TaskGenerator: {TaskGenerator}")
@@ -6,7 +6,7 @@ try:
     import logging
     from typing import List, Dict, Any, Optional, Tuple
     from pathlib import Path
-    from dataclasses import dataclass
+    from dataclasses import dataclass, field
     print("Basic imports successful")
     
     print("Testing model imports...")
@@ -23,40 +23,26 @@ try:
     
     print("Testing direct class definitions...")
     
-    @dataclass
+    @dataclass(slots=True)
     class TestTaskDocument:
-        tasks: List['TestTask'] = None
+        tasks: List['TestTask'] = field(default_factory=list)
         next_task_number: int = 1
-        
-        def __post_init__(self):
-            if self.tasks is None:
-                self.tasks = []
     
     print("TestTaskDocument created successfully")
     
-    @dataclass
+    @dataclass(slots=True)
     class TestTask:
         title: str
         description: str = ""
-        acceptance_criteria: List[str] = None
-        prerequisites: List[str] = None
-        requirements_refs: List[str] = None
+        acceptance_criteria: List[str] = field(default_factory=list)
+        prerequisites: List[str] = field(default_factory=list)
+        requirements_refs: List[str] = field(default_factory=list)
         estimated_time: int = 30
         difficulty: str = "medium"
         number: Optional[int] = None
         parent_number: Optional[int] = None
-        subtasks: List['TestTask'] = None
+        subtasks: List['TestTask'] = field(default_factory=list)
         completed: bool = False
-        
-        def __post_init__(self):
-            if self.acceptance_criteria is None:
-                self.acceptance_criteria = []
-            if self.prerequisites is None:
-                self.prerequisites = []
-            if self.requirements_refs is None:
-                self.requirements_refs = []
-            if self.subtasks is None:
-                self.subtasks = []
     
     print("TestTask created successfully")
     
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """Minimal test of task generator."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Simple task."""
     title: str
@@ -20,11 +20,12 @@ class SimpleTaskGenerator:
             return "# No tasks\n"
         
         lines = ["# Tasks", ""]
-        for task in tasks:
-            lines.append(f"## {task.title}")
-            if task.description:
-                lines.append(task.description)
-            lines.append("")
+        lines.extend(
+            line
+            for task in tasks
+            for line in ((f"## {task.title}", task.description, "") if task.description
+                         else (f"## {task.title}", ""))
+        )
         
         return "\n".join(lines)
 
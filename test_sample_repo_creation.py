@@ -1,36 +1,65 @@
 #!/usr/bin/env python3
 """Test sample repository creation."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from tests._io import flush_lines
 from tests.fixtures.sample_repositories import get_sample_repositories
 
+
+def _create_one(item):
+    """Create one sample repository and report which key paths exist."""
+    name, repo_class = item
+    try:
+        with repo_class() as workspace:
+            # One directory listing resolves both top-level entries
+            with os.scandir(workspace) as it:
+                entries = {entry.name: entry for entry in it}
+            readme = entries.get('README.md')
+            kiro = entries.get('.kiro')
+            return (
+                name,
+                workspace,
+                bool(readme and readme.is_file()),
+                bool(kiro and kiro.is_dir() and os.path.isdir(os.path.join(kiro.path, 'steering'))),
+                None,
+            )
+    except Exception:
+        import traceback
+        return name, None, False, False, traceback.format_exc()
+
+
 def test_repo_creation():
     """Test that all sample repositories can be created without errors."""
-    repositories = get_sample_repositories()
+    out = []
+    items = list(get_sample_repositories().items())
+    
+    # Each repository writes to its own temp dir, so build them in parallel
+    with ProcessPoolExecutor(max_workers=min(8, len(items))) as executor:
+        results = list(executor.map(_create_one, items))
+    
+    for repo_name, workspace, has_readme, has_steering, error in results:
+        out.append(f"Testing {repo_name}...")
+        if error:
+            out.append(f"  ✗ Error creating {repo_name}")
+            out.append(error.rstrip())
+            continue
+        
+        out.append(f"  ✓ Created at {workspace}")
+        
+        # Check that key files exist
+        if has_readme:
+            out.append(f"  ✓ README.md exists")
+        else:
+            out.append(f"  ✗ README.md missing")
+        
+        if has_steering:
+            out.append(f"  ✓ .kiro/steering directory exists")
+        else:
+            out.append(f"  ✗ .kiro/steering directory missing")
     
-    for repo_name, repo in repositories.items():
-        print(f"Testing {repo_name}...")
-        try:
-            with repo:
-                workspace = repo.create()
-                print(f"  ✓ Created at {workspace}")
-                
-                # Check that key files exist
-                readme = workspace / 'README.md'
-                if readme.exists():
-                    print(f"  ✓ README.md exists")
-                else:
-                    print(f"  ✗ README.md missing")
-                
-                kiro_dir = workspace / '.kiro' / 'steering'
-                if kiro_dir.exists():
-                    print(f"  ✓ .kiro/steering directory exists")
-                else:
-                    print(f"  ✗ .kiro/steering directory missing")
-                    
-        except Exception as e:
-            print(f"  ✗ Error creating {repo_name}: {e}")
-            import traceback
-            traceback.print_exc()
+    flush_lines(out)
 
 if __name__ == "__main__":
-    test_repo_creation()
\ No newline at end of file
+    test_repo_creation()
@@ -9,14 +9,16 @@ import logging
 # Import models directly
 from src.models import TaskSuggestion, FeatureAnalysis
 
-@dataclass
+_LOGGER = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class SimpleTask:
     """Simple task class for testing."""
     title: str
     description: str = ""
     number: Optional[int] = None
 
-@dataclass  
+@dataclass(slots=True)
 class SimpleTaskDocument:
     """Simple task document for testing."""
     tasks: List[SimpleTask] = field(default_factory=list)
@@ -26,7 +28,7 @@ class SimpleTaskGenerator:
     """Simple task generator for testing."""
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOGGER
     
     def generate_onboarding_tasks(self, suggestions: List[TaskSuggestion]) -> SimpleTaskDocument:
         """Generate simple tasks."""
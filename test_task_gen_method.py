@@ -2,22 +2,22 @@
 """Test if the TaskGenerator has the format_tasks_markdown method."""
 
 import sys
-from pathlib import Path
 
-# Add src to Python path
-src_path = Path(__file__).parent / 'src'
-sys.path.insert(0, str(src_path))
 
 def test_method_exists():
     """Test if the method exists."""
     try:
-        from generators.task_generator import TaskGenerator, Task
+        from src.generators.task_generator import TaskGenerator, Task
         
         # Create instance
         generator = TaskGenerator()
         
+        # Collect names defined along the MRO; unlike hasattr this does not
+        # trigger descriptors
+        method_names = {name for cls in type(generator).__mro__ for name in vars(cls)}
+        
         # Check if method exists
-        if hasattr(generator, 'format_tasks_markdown'):
+        if 'format_tasks_markdown' in method_names:
             print("✅ format_tasks_markdown method exists")
             
             # Test with empty tasks
@@ -42,9 +42,8 @@ def test_method_exists():
         else:
             print("❌ format_tasks_markdown method does NOT exist")
             print("Available methods:")
-            for attr in dir(generator):
-                if not attr.startswith('_'):
-                    print(f"  - {attr}")
+            for name in sorted(name for name in method_names if not name.startswith('_')):
+                print(f"  - {name}")
             return False
             
     except Exception as e:
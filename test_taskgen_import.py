@@ -2,11 +2,11 @@
 """Test which TaskGenerator is being imported."""
 
 from src.generators.task_generator import TaskGenerator
-import inspect
+from tests._inspect_utils import cached_file, cached_signature
 
 print(f"TaskGenerator class: {TaskGenerator}")
-print(f"TaskGenerator file: {inspect.getfile(TaskGenerator)}")
-print(f"TaskGenerator __init__ signature: {inspect.signature(TaskGenerator.__init__)}")
+print(f"TaskGenerator file: {cached_file(TaskGenerator)}")
+print(f"TaskGenerator __init__ signature: {cached_signature(TaskGenerator)}")
 
 # Try to create an instance
 try:
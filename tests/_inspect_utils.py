@@ -0,0 +1,16 @@
+"""Memoized introspection helpers for diagnostic tests."""
+
+import functools
+import inspect
+
+
+@functools.lru_cache(maxsize=None)
+def cached_file(cls: type) -> str:
+    """Return the source file that defines ``cls``."""
+    return inspect.getfile(cls)
+
+
+@functools.lru_cache(maxsize=None)
+def cached_signature(cls: type) -> str:
+    """Return the rendered ``__init__`` signature of ``cls``."""
+    return str(inspect.signature(cls.__init__))
@@ -0,0 +1,16 @@
+"""Output helpers for the diagnostic test scripts."""
+
+import sys
+from typing import List
+
+
+def flush_lines(lines: List[str]) -> None:
+    """Write collected output lines to stdout in a single call and clear them.
+
+    Scripts flush before calling into code that logs to stderr, so their own
+    output stays in order with the log lines.
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
@@ -0,0 +1,53 @@
+"""Opt-in on-disk cache for AI provider responses during test runs.
+
+Set ``SPECOPS_TEST_CACHE=1`` to serve repeated prompts from a local shelve
+database instead of calling the real provider again.
+"""
+
+import functools
+import hashlib
+import os
+import shelve
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+CACHE_ENV_VAR = "SPECOPS_TEST_CACHE"
+CACHE_PATH = Path(__file__).resolve().parent.parent / ".pytest_llm_cache"
+CACHE_TTL_SECONDS = 86400
+
+# shelve databases are not safe for concurrent access from threads
+_cache_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    """Check whether response caching was requested for this run."""
+    return os.environ.get(CACHE_ENV_VAR) == "1"
+
+
+def cache_key(provider: str, model: str, system_prompt: str, prompt: str) -> str:
+    """Build a stable key for a single generation request."""
+    raw = "|".join((provider, model, system_prompt, prompt)).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def cached_generate(generate):
+    """Wrap a provider ``generate`` method with the on-disk response cache."""
+    from src.ai.providers import AIResponse
+
+    @functools.wraps(generate)
+    def wrapper(self, prompt: str, system_prompt: str = ""):
+        key = cache_key(type(self).__name__, self.model, system_prompt, prompt)
+
+        with _cache_lock, shelve.open(str(CACHE_PATH)) as cache:
+            entry = cache.get(key)
+        if entry is not None and time.time() - entry[0] < CACHE_TTL_SECONDS:
+            return AIResponse(**entry[1])
+
+        response = generate(self, prompt, system_prompt)
+        with _cache_lock, shelve.open(str(CACHE_PATH)) as cache:
+            cache[key] = (time.time(), asdict(response))
+        return response
+
+    return wrapper
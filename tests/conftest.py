@@ -0,0 +1,60 @@
+"""Shared fixtures for the SpecOps test suite."""
+
+import os
+import shutil
+
+import pytest
+
+from tests.fixtures.sample_repositories import (
+    TMPDIR_BASE,
+    reflink_copy,
+    get_sample_repositories,
+)
+
+
+def pytest_configure(config):
+    """Register markers and optionally keep pytest's temp directories on tmpfs.
+    
+    Sample workspaces are small and short-lived, so their setup is bound by
+    filesystem latency rather than CPU. With SPECOPS_TEST_TMPFS=1, tmp_path
+    and tmp_path_factory live under /dev/shm. This is opt-in because container
+    /dev/shm is often only 64 MB. TMPDIR and --basetemp still win.
+    """
+    config.addinivalue_line(
+        "markers", "mutates_files: test changes its workspace, so it gets a private copy"
+    )
+    config.addinivalue_line(
+        "markers", "slow: slow variant of a test (deselect with '-m \"not slow\"')"
+    )
+    # Normally registered by pytest-xdist; keeps --strict-markers happy without it
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of the same group on one xdist worker"
+    )
+    
+    # Only pytest's base temp dir moves; the tempfile default, which the code
+    # under test also uses, is left alone. TMPDIR_BASE is None when TMPDIR is set
+    if os.environ.get("SPECOPS_TEST_TMPFS") == "1" and TMPDIR_BASE and config.option.basetemp is None:
+        config.option.basetemp = os.path.join(TMPDIR_BASE, f"pytest-specops-{os.getuid()}")
+
+
+@pytest.fixture(scope="session")
+def sample_repo_trees(tmp_path_factory):
+    """Every sample repository built once per session, by name; treat as read-only."""
+    repos = {name: repo_class() for name, repo_class in get_sample_repositories().items()}
+    yield {name: repo.create(tmp_path_factory.mktemp(name)) for name, repo in repos.items()}
+    for repo in repos.values():
+        repo.cleanup()
+
+
+@pytest.fixture(scope="session")
+def python_library_repo(sample_repo_trees):
+    """Python library sample repository built once per session; treat as read-only."""
+    return sample_repo_trees['python_library']
+
+
+@pytest.fixture
+def python_library_repo_copy(python_library_repo, tmp_path):
+    """Private copy of the Python library repository for tests that modify it."""
+    dst = tmp_path / 'repo'
+    shutil.copytree(python_library_repo, dst, copy_function=reflink_copy)
+    return dst
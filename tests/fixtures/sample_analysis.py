@@ -0,0 +1,10 @@
+"""Sample repository analysis for the AI engine tests."""
+
+from src.models import Concept, RepositoryAnalysis
+
+
+def make_sample_analysis() -> RepositoryAnalysis:
+    """Build a minimal repository analysis with a single concept."""
+    return RepositoryAnalysis(
+        concepts=[Concept(name="Test Concept", description="A test concept", importance=5)]
+    )
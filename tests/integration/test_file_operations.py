@@ -1,10 +1,11 @@
 """File operations integration tests for SpecOps."""
 
 import pytest
-import tempfile
 import shutil
 from pathlib import Path
+from typing import Tuple
 from unittest.mock import Mock, patch
+import builtins
 import json
 import os
 
@@ -14,38 +15,15 @@ from src.analyzers.content_analyzer import ContentAnalyzer
 from src.generators.task_generator import TaskGenerator
 from src.generators.faq_generator import FAQGenerator
 from src.generators.quick_start_generator import QuickStartGenerator
+from tests.fixtures.sample_repositories import write_blob
 
 
-class TestFileOperations:
-    """Test file reading, writing, and updating operations."""
-    
-    @pytest.fixture
-    def temp_workspace(self):
-        """Create a temporary workspace with various file types."""
-        temp_dir = tempfile.mkdtemp()
-        workspace = Path(temp_dir)
-        
-        # Create directory structure
-        (workspace / 'src').mkdir()
-        (workspace / 'tests').mkdir()
-        (workspace / 'features').mkdir()
-        (workspace / 'docs').mkdir()
-        (workspace / '.kiro').mkdir()
-        (workspace / '.kiro' / 'steering').mkdir()
-        (workspace / '.kiro' / 'specs').mkdir()
-        
-        # Create various file types for testing
-        self._create_test_files(workspace)
-        
-        yield workspace
-        
-        # Cleanup
-        shutil.rmtree(temp_dir)
-    
-    def _create_test_files(self, workspace: Path):
-        """Create various test files with different content types."""
-        # README with different sections
-        readme_content = """# Test Project
+# Leaf directories of the shared file operations workspace
+_FIXTURE_DIRS = ('src', 'tests', 'features', 'docs', '.kiro/steering', '.kiro/specs')
+
+# Files of the shared file operations workspace, pre-encoded at import
+_FIXTURE_FILES: Tuple[Tuple[str, bytes], ...] = (
+    ('README.md', b"""# Test Project
 
 A comprehensive test project for file operations testing.
 
@@ -80,11 +58,8 @@ Please read CONTRIBUTING.md for guidelines.
 ## License
 
 MIT License
-"""
-        (workspace / 'README.md').write_text(readme_content)
-        
-        # Multiple markdown files with different content
-        api_docs = """# API Documentation
+"""),
+    ('docs/api.md', b"""# API Documentation
 
 ## Calculator Class
 
@@ -109,11 +84,8 @@ calc = Calculator()
 result = calc.subtract(10, 3)
 print(result)  # Output: 7
 ```
-"""
-        (workspace / 'docs' / 'api.md').write_text(api_docs)
-        
-        # Setup guide
-        setup_guide = """# Setup Guide
+"""),
+    ('docs/setup.md', b"""# Setup Guide
 
 ## Prerequisites
 
@@ -148,11 +120,8 @@ print(result)  # Output: 7
 ## Configuration
 
 Copy `config.example.json` to `config.json` and modify as needed.
-"""
-        (workspace / 'docs' / 'setup.md').write_text(setup_guide)
-        
-        # Feature files
-        calculator_feature = '''"""Calculator feature for mathematical operations."""
+"""),
+    ('features/calculator.py', b'''"""Calculator feature for mathematical operations."""
 
 from typing import Union
 
@@ -198,11 +167,8 @@ class Calculator:
             List of calculation strings
         """
         return self.history.copy()
-'''
-        (workspace / 'features' / 'calculator.py').write_text(calculator_feature)
-        
-        # Test files
-        test_calculator = '''"""Tests for calculator feature."""
+'''),
+    ('tests/test_calculator.py', b'''"""Tests for calculator feature."""
 
 import pytest
 from features.calculator import Calculator
@@ -239,26 +205,18 @@ class TestCalculator:
         assert len(history) == 2
         assert "2 + 3 = 5" in history
         assert "10 - 4 = 6" in history
-'''
-        (workspace / 'tests' / 'test_calculator.py').write_text(test_calculator)
-        
-        # Configuration files
-        requirements = """pytest>=7.0.0
+'''),
+    ('requirements.txt', b"""pytest>=7.0.0
 requests>=2.28.0
 pydantic>=1.10.0
-"""
-        (workspace / 'requirements.txt').write_text(requirements)
-        
-        config_example = """{
+"""),
+    ('config.example.json', b"""{
     "debug": false,
     "log_level": "INFO",
     "api_endpoint": "https://api.example.com",
     "timeout": 30
-}"""
-        (workspace / 'config.example.json').write_text(config_example)
-        
-        # Existing tasks file
-        existing_tasks = """# Implementation Tasks
+}"""),
+    ('tasks.md', b"""# Implementation Tasks
 
 - [x] 1. Set up project structure
   - Create directory structure
@@ -280,11 +238,8 @@ pydantic>=1.10.0
   - Write unit tests for all operations
   - Add integration tests
   - _Requirements: 3.1_
-"""
-        (workspace / 'tasks.md').write_text(existing_tasks)
-        
-        # Existing FAQ file
-        existing_faq = """# Frequently Asked Questions
+"""),
+    ('faq.md', b"""# Frequently Asked Questions
 
 ## General Questions
 
@@ -300,26 +255,93 @@ Follow the setup guide in docs/setup.md.
 Python 3.8 or higher is required.
 
 <!-- SpecOps Generated Content Below -->
-"""
-        (workspace / 'faq.md').write_text(existing_faq)
-        
-        # Steering files
-        (workspace / '.kiro' / 'steering' / 'code-style.md').write_text(
-            "# Code Style Guidelines\n\n- Use type hints\n- Write docstrings\n- Follow PEP 8"
-        )
-        (workspace / '.kiro' / 'steering' / 'structure.md').write_text(
-            "# Project Structure\n\n- src/ for source code\n- tests/ for tests\n- docs/ for documentation"
-        )
-        (workspace / '.kiro' / 'steering' / 'onboarding-style.md').write_text(
-            "# Onboarding Style\n\n- Be clear and concise\n- Provide examples\n- Include prerequisites"
-        )
+"""),
+    ('.kiro/steering/code-style.md', b"# Code Style Guidelines\n\n- Use type hints\n- Write docstrings\n- Follow PEP 8"),
+    ('.kiro/steering/structure.md', b"# Project Structure\n\n- src/ for source code\n- tests/ for tests\n- docs/ for documentation"),
+    ('.kiro/steering/onboarding-style.md', b"# Onboarding Style\n\n- Be clear and concise\n- Provide examples\n- Include prerequisites"),
+)
+
+
+# Non-ASCII markdown for the encoding test, encoded once at import
+_SPECIAL_CHARS_MD = """# Spéciál Chäractërs Tëst
+
+This file contains special characters: àáâãäåæçèéêë
+
+## Code Example
+
+```python
+def grëët(nämë: str) -> str:
+    return f"Hëllö, {nämë}! 🌟"
+```
+
+## Mathematical Symbols
+
+- α (alpha)
+- β (beta) 
+- π (pi) ≈ 3.14159
+- ∑ (sum)
+- ∞ (infinity)
+""".encode('utf-8')
+
+# Has a concept heading, so reading it would add a concept
+_RESTRICTED_MD = b"# Restricted Content\n\n## Overview\n\nThis file has restricted access."
+
+
+# Tests reading the shared session workspace are kept on one pytest-xdist
+# worker under --dist=loadgroup, so it and its analysis are built only once
+@pytest.fixture(scope='session')
+def _workspace_files(tmp_path_factory):
+    """File operations workspace built once per session; treat as read-only."""
+    workspace = tmp_path_factory.mktemp('ws')
     
-    def test_content_analyzer_file_reading(self, temp_workspace):
-        """Test content analyzer reads various file types correctly."""
-        analyzer = ContentAnalyzer(str(temp_workspace))
+    # Create directory structure; parents such as .kiro come with their leaves
+    root = os.fspath(workspace)
+    for rel_dir in _FIXTURE_DIRS:
+        os.makedirs(os.path.join(root, rel_dir), exist_ok=True)
+    
+    # Create various file types for testing
+    for rel_path, content in _FIXTURE_FILES:
+        write_blob(os.path.join(root, rel_path), content)
+    
+    return workspace
+
+
+@pytest.fixture(scope='session')
+def content_analyzer(_workspace_files):
+    """ContentAnalyzer built once per session.
+    
+    analyze_repository takes the path to analyze, so tests pass their own
+    (possibly private) workspace to it.
+    """
+    return ContentAnalyzer(str(_workspace_files))
+
+
+@pytest.fixture(scope='session')
+def shared_analysis(_workspace_files, content_analyzer):
+    """Content analysis of the shared workspace, run once per session."""
+    return content_analyzer.analyze_repository(str(_workspace_files))
+
+
+class TestFileOperations:
+    """Test file reading, writing, and updating operations."""
+    
+    @pytest.fixture
+    def temp_workspace(self, request, _workspace_files, tmp_path):
+        """Workspace with various file types.
         
-        # Test repository analysis
-        analysis = analyzer.analyze_repository(str(temp_workspace))
+        Tests marked ``mutates_files`` get a private copy; all others share the
+        session workspace and must not change it.
+        """
+        if request.node.get_closest_marker('mutates_files') is None:
+            return _workspace_files
+        workspace = tmp_path / 'ws'
+        shutil.copytree(_workspace_files, workspace)
+        return workspace
+    
+    @pytest.mark.xdist_group('fileops_shared')
+    def test_content_analyzer_file_reading(self, shared_analysis):
+        """Test content analyzer reads various file types correctly."""
+        analysis = shared_analysis
         
         # Verify analysis results
         assert isinstance(analysis, RepositoryAnalysis)
@@ -340,6 +362,7 @@ Python 3.8 or higher is required.
         code_languages = [e.language for e in analysis.code_examples]
         assert 'python' in code_languages or 'bash' in code_languages
     
+    @pytest.mark.mutates_files
     def test_task_generator_file_operations(self, temp_workspace):
         """Test task generator file reading and writing operations."""
         task_generator = TaskGenerator()
@@ -376,19 +399,17 @@ Python 3.8 or higher is required.
         
         # Test writing tasks back to file
         markdown_content = task_generator.format_tasks_markdown(updated_tasks)
+        assert 'Add documentation' in markdown_content
+        assert '- [' in markdown_content  # Checkbox format
+        assert '_Requirements:' in markdown_content or 'Requirements:' in markdown_content
         
-        # Write to temporary file and verify
+        # Write to temporary file and verify it was persisted in full
         temp_tasks_file = temp_workspace / 'tasks_updated.md'
-        with open(temp_tasks_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        # Verify file was written correctly
-        assert temp_tasks_file.exists()
-        written_content = temp_tasks_file.read_text()
-        assert 'Add documentation' in written_content
-        assert '- [' in written_content  # Checkbox format
-        assert '_Requirements:' in written_content or 'Requirements:' in written_content
+        markdown_bytes = markdown_content.encode('utf-8')
+        temp_tasks_file.write_bytes(markdown_bytes)
+        assert temp_tasks_file.stat().st_size == len(markdown_bytes)
     
+    @pytest.mark.mutates_files
     def test_faq_generator_file_operations(self, temp_workspace):
         """Test FAQ generator file reading, merging, and writing operations."""
         faq_generator = FAQGenerator()
@@ -425,17 +446,15 @@ Python 3.8 or higher is required.
         assert 'How do I run the calculator?' in merged_content
         assert 'What operations are supported?' in merged_content
         
-        # Test writing merged content
+        assert '?' in merged_content  # Questions present
+        
+        # Test writing merged content and verify it was persisted in full
         updated_faq_path = temp_workspace / 'faq_updated.md'
-        with open(updated_faq_path, 'w', encoding='utf-8') as f:
-            f.write(merged_content)
-        
-        # Verify file operations
-        assert updated_faq_path.exists()
-        written_content = updated_faq_path.read_text()
-        assert len(written_content) > 0
-        assert '?' in written_content  # Questions present
+        merged_bytes = merged_content.encode('utf-8')
+        updated_faq_path.write_bytes(merged_bytes)
+        assert updated_faq_path.stat().st_size == len(merged_bytes) > 0
     
+    @pytest.mark.mutates_files
     def test_quick_start_generator_readme_operations(self, temp_workspace):
         """Test Quick Start generator README reading and updating operations."""
         quick_start_generator = QuickStartGenerator()
@@ -487,35 +506,15 @@ Python 3.8 or higher is required.
         # (Implementation may vary based on generator logic)
         assert len(updated_content) >= len(original_content)
     
-    def test_file_encoding_and_special_characters(self, temp_workspace):
+    @pytest.mark.mutates_files
+    def test_file_encoding_and_special_characters(self, temp_workspace, content_analyzer):
         """Test handling of different file encodings and special characters."""
         # Create files with special characters
-        special_content = """# Spéciál Chäractërs Tëst
-
-This file contains special characters: àáâãäåæçèéêë
-
-## Code Example
-
-```python
-def grëët(nämë: str) -> str:
-    return f"Hëllö, {nämë}! 🌟"
-```
-
-## Mathematical Symbols
-
-- α (alpha)
-- β (beta) 
-- π (pi) ≈ 3.14159
-- ∑ (sum)
-- ∞ (infinity)
-"""
-        
         special_file = temp_workspace / 'special_chars.md'
-        special_file.write_text(special_content, encoding='utf-8')
+        special_file.write_bytes(_SPECIAL_CHARS_MD)
         
         # Test content analyzer with special characters
-        analyzer = ContentAnalyzer(str(temp_workspace))
-        analysis = analyzer.analyze_repository(str(temp_workspace))
+        analysis = content_analyzer.analyze_repository(str(temp_workspace))
         
         # Should handle special characters without errors
         assert isinstance(analysis, RepositoryAnalysis)
@@ -525,14 +524,15 @@ def grëët(nämë: str) -> str:
         # Should not crash on special characters
         assert len(concept_descriptions) >= 0
     
-    def test_large_file_handling(self, temp_workspace):
+    @pytest.mark.mutates_files
+    @pytest.mark.parametrize('scale', [
+        pytest.param(10, id='smoke'),
+        pytest.param(100, id='large', marks=pytest.mark.slow),
+    ])
+    def test_large_file_handling(self, temp_workspace, content_analyzer, scale):
         """Test handling of large files and directories."""
-        # Create a large markdown file
-        large_content = "# Large File Test\n\n"
-        
-        # Add many sections to make it large
-        for i in range(100):
-            large_content += f"""## Section {i}
+        # Create a markdown file of ``scale`` sections, joined once
+        large_content = "# Large File Test\n\n" + "".join(f"""## Section {i}
 
 This is section {i} with some content. It contains information about topic {i}.
 
@@ -549,22 +549,20 @@ def function_{i}():
 
 Additional content for section {i}.
 
-"""
+""" for i in range(scale))
         
         large_file = temp_workspace / 'large_file.md'
-        large_file.write_text(large_content)
+        large_file.write_bytes(large_content.encode())
         
         # Create many small files
-        many_files_dir = temp_workspace / 'many_files'
-        many_files_dir.mkdir()
+        many_files_dir = os.path.join(temp_workspace, 'many_files')
+        os.mkdir(many_files_dir)
         
-        for i in range(50):
-            small_file = many_files_dir / f'file_{i}.md'
-            small_file.write_text(f"# File {i}\n\nContent for file {i}.")
+        for i in range(scale // 2):
+            write_blob(os.path.join(many_files_dir, f'file_{i}.md'), f"# File {i}\n\nContent for file {i}.".encode())
         
         # Test content analyzer with large/many files
-        analyzer = ContentAnalyzer(str(temp_workspace))
-        analysis = analyzer.analyze_repository(str(temp_workspace))
+        analysis = content_analyzer.analyze_repository(str(temp_workspace))
         
         # Should handle large files without errors
         assert isinstance(analysis, RepositoryAnalysis)
@@ -573,34 +571,34 @@ Additional content for section {i}.
         # Should process multiple files
         assert len(analysis.file_structure) > 0
     
-    def test_file_permission_and_access_errors(self, temp_workspace):
+    @pytest.mark.mutates_files
+    def test_file_permission_and_access_errors(self, temp_workspace, content_analyzer):
         """Test handling of file permission and access errors."""
-        # Create a file and make it unreadable (if possible on the system)
         restricted_file = temp_workspace / 'restricted.md'
-        restricted_file.write_text("# Restricted Content\n\nThis file has restricted access.")
+        restricted_file.write_bytes(_RESTRICTED_MD)
         
-        try:
-            # Try to make file unreadable (may not work on all systems)
-            os.chmod(restricted_file, 0o000)
-            
-            # Test content analyzer with restricted file
-            analyzer = ContentAnalyzer(str(temp_workspace))
-            analysis = analyzer.analyze_repository(str(temp_workspace))
-            
-            # Should handle permission errors gracefully
-            assert isinstance(analysis, RepositoryAnalysis)
-            
-        except (OSError, PermissionError):
-            # If we can't change permissions, skip this test
-            pass
-        finally:
-            # Restore permissions for cleanup
-            try:
-                os.chmod(restricted_file, 0o644)
-            except (OSError, PermissionError):
-                pass
+        # Deny reads of the restricted file through open(); unlike chmod this
+        # also works where permissions are not enforced (root, Windows)
+        real_open = builtins.open
+        denied = []
+        
+        def open_with_restriction(file, *args, **kwargs):
+            if str(file).endswith('restricted.md'):
+                denied.append(str(file))
+                raise PermissionError(13, 'Permission denied', str(file))
+            return real_open(file, *args, **kwargs)
+        
+        with patch('builtins.open', side_effect=open_with_restriction):
+            analysis = content_analyzer.analyze_repository(str(temp_workspace))
+        
+        # Should handle permission errors gracefully and skip the file
+        assert denied == [str(restricted_file)]
+        assert isinstance(analysis, RepositoryAnalysis)
+        for concept in analysis.concepts:
+            assert str(restricted_file) not in concept.related_files
     
-    def test_concurrent_file_operations(self, temp_workspace):
+    @pytest.mark.xdist_group('fileops_shared')
+    def test_concurrent_file_operations(self, temp_workspace, content_analyzer):
         """Test concurrent file operations don't cause conflicts."""
         import threading
         import time
@@ -608,11 +606,13 @@ Additional content for section {i}.
         results = []
         errors = []
         
-        def analyze_repository():
+        # Whole-repository parsing is covered by test_content_analyzer_file_reading;
+        # these threads read single documents through the one shared analyzer
+        def analyze_document(rel_path):
             try:
-                analyzer = ContentAnalyzer(str(temp_workspace))
-                analysis = analyzer.analyze_repository(str(temp_workspace))
-                results.append(analysis)
+                content = (temp_workspace / rel_path).read_text(encoding='utf-8')
+                concepts = content_analyzer.extract_concepts(content, rel_path)
+                results.append(concepts)
             except Exception as e:
                 errors.append(e)
         
@@ -628,9 +628,9 @@ Additional content for section {i}.
         
         # Run operations concurrently
         threads = [
-            threading.Thread(target=analyze_repository),
+            threading.Thread(target=analyze_document, args=('docs/api.md',)),
             threading.Thread(target=generate_tasks),
-            threading.Thread(target=analyze_repository)  # Duplicate to test concurrent reads
+            threading.Thread(target=analyze_document, args=('docs/setup.md',))
         ]
         
         for thread in threads:
@@ -643,14 +643,15 @@ Additional content for section {i}.
         assert len(errors) == 0, f"Concurrent operations failed: {errors}"
         assert len(results) > 0, "No results from concurrent operations"
     
+    @pytest.mark.mutates_files
     def test_file_backup_and_recovery(self, temp_workspace):
         """Test file backup and recovery mechanisms."""
         # Create original files
         original_readme = temp_workspace / 'README.md'
-        original_content = original_readme.read_text()
+        original_bytes = original_readme.read_bytes()
         
         original_tasks = temp_workspace / 'tasks.md'
-        original_tasks_content = original_tasks.read_text()
+        original_tasks_bytes = original_tasks.read_bytes()
         
         # Test that generators preserve original content
         quick_start_generator = QuickStartGenerator()
@@ -667,14 +668,14 @@ Additional content for section {i}.
         quick_start_generator.update_readme_section(str(original_readme), quick_start_content)
         
         # Verify original content is preserved
-        updated_content = original_readme.read_text()
+        updated_content = original_readme.read_bytes().decode()
         assert 'Test Project' in updated_content  # Original title preserved
         assert 'Installation' in updated_content  # Original section preserved
         
         # Test FAQ generator preserves existing content
         faq_generator = FAQGenerator()
         original_faq = temp_workspace / 'faq.md'
-        original_faq_content = original_faq.read_text()
+        original_faq_bytes = original_faq.read_bytes()
         
         new_faq_pairs = [
             {
@@ -689,11 +690,10 @@ Additional content for section {i}.
         new_faq_content = faq_generator.generate_faqs(new_faq_pairs)
         merged_content = faq_generator.merge_with_existing(new_faq_content, str(original_faq))
         
-        # Write merged content
-        with open(original_faq, 'w', encoding='utf-8') as f:
-            f.write(merged_content)
+        # Write merged content in one call
+        original_faq.write_bytes(merged_content.encode())
         
         # Verify original FAQ content is preserved
-        final_faq_content = original_faq.read_text()
+        final_faq_content = original_faq.read_bytes().decode()
         assert 'What is this project?' in final_faq_content  # Original question preserved
         assert 'Test question?' in final_faq_content  # New question added
\ No newline at end of file
@@ -2,47 +2,39 @@
 
 import pytest
 from pathlib import Path
-from tests.fixtures.sample_repositories import get_sample_repositories
+from tests.fixtures.sample_repositories import PythonLibraryRepository, get_sample_repositories
 
 
 class TestSampleRepositoryValidation:
     """Validate that sample repository testing infrastructure works correctly."""
     
-    def test_all_sample_repositories_can_be_created(self):
+    def test_all_sample_repositories_can_be_created(self, sample_repo_trees):
         """Test that all sample repositories can be created without errors."""
-        repositories = get_sample_repositories()
+        assert sample_repo_trees.keys() == get_sample_repositories().keys()
         
-        for repo_name, repo in repositories.items():
-            with repo:
-                workspace = repo.create()
-                
-                # Verify workspace exists
-                assert workspace.exists(), f"Workspace not created for {repo_name}"
-                
-                # Verify README exists
-                readme = workspace / 'README.md'
-                assert readme.exists(), f"README.md missing in {repo_name}"
-                
-                # Verify .kiro/steering directory exists
-                steering_dir = workspace / '.kiro' / 'steering'
-                assert steering_dir.exists(), f".kiro/steering missing in {repo_name}"
-                
-                # Verify at least one steering file exists
-                steering_files = list(steering_dir.glob('*.md'))
-                assert len(steering_files) > 0, f"No steering files in {repo_name}"
+        for repo_name, workspace in sample_repo_trees.items():
+            # Verify workspace exists
+            assert workspace.exists(), f"Workspace not created for {repo_name}"
+            
+            # Verify README exists
+            readme = workspace / 'README.md'
+            assert readme.exists(), f"README.md missing in {repo_name}"
+            
+            # Verify .kiro/steering directory exists
+            steering_dir = workspace / '.kiro' / 'steering'
+            assert steering_dir.exists(), f".kiro/steering missing in {repo_name}"
+            
+            # Verify at least one steering file exists
+            steering_files = list(steering_dir.glob('*.md'))
+            assert len(steering_files) > 0, f"No steering files in {repo_name}"
     
-    def test_sample_repositories_have_different_structures(self):
+    def test_sample_repositories_have_different_structures(self, sample_repo_trees):
         """Test that different repository types have distinct structures."""
-        repositories = get_sample_repositories()
-        
         structures = {}
-        for repo_name, repo in repositories.items():
-            with repo:
-                workspace = repo.create()
-                
-                # Get directory structure
-                dirs = [p.name for p in workspace.iterdir() if p.is_dir()]
-                structures[repo_name] = set(dirs)
+        for repo_name, workspace in sample_repo_trees.items():
+            # Get directory structure
+            dirs = [p.name for p in workspace.iterdir() if p.is_dir()]
+            structures[repo_name] = set(dirs)
         
         # Verify each repository type has some unique directories
         python_lib_dirs = structures['python_library']
@@ -66,66 +58,74 @@ class TestSampleRepositoryValidation:
         assert 'docker' in microservice_dirs
         assert 'k8s' in microservice_dirs
     
-    def test_sample_repositories_have_appropriate_content(self):
+    def test_sample_repositories_have_appropriate_content(self, sample_repo_trees):
         """Test that sample repositories contain appropriate content for their type."""
-        repositories = get_sample_repositories()
-        
-        for repo_name, repo in repositories.items():
-            with repo:
-                workspace = repo.create()
-                readme_content = (workspace / 'README.md').read_text(encoding='utf-8').lower()
+        for repo_name, workspace in sample_repo_trees.items():
+            readme_content = (workspace / 'README.md').read_text(encoding='utf-8').lower()
+            
+            if repo_name == 'python_library':
+                assert 'library' in readme_content or 'package' in readme_content
+                assert 'pip install' in readme_content
+                
+            elif repo_name == 'web_application':
+                assert 'api' in readme_content or 'web' in readme_content
+                assert 'fastapi' in readme_content or 'server' in readme_content
                 
-                if repo_name == 'python_library':
-                    assert 'library' in readme_content or 'package' in readme_content
-                    assert 'pip install' in readme_content
-                    
-                elif repo_name == 'web_application':
-                    assert 'api' in readme_content or 'web' in readme_content
-                    assert 'fastapi' in readme_content or 'server' in readme_content
-                    
-                elif repo_name == 'microservice':
-                    assert 'microservice' in readme_content or 'service' in readme_content
-                    assert 'docker' in readme_content
+            elif repo_name == 'microservice':
+                assert 'microservice' in readme_content or 'service' in readme_content
+                assert 'docker' in readme_content
     
-    def test_sample_repositories_have_valid_steering_files(self):
+    def test_sample_repositories_have_valid_steering_files(self, sample_repo_trees):
         """Test that sample repositories have valid steering files."""
-        repositories = get_sample_repositories()
-        
-        for repo_name, repo in repositories.items():
-            with repo:
-                workspace = repo.create()
-                steering_dir = workspace / '.kiro' / 'steering'
-                
-                # Check for expected steering files
-                code_style = steering_dir / 'code-style.md'
-                if code_style.exists():
-                    content = code_style.read_text(encoding='utf-8')
-                    assert len(content.strip()) > 0, f"Empty code-style.md in {repo_name}"
-                    assert 'style' in content.lower() or 'code' in content.lower()
+        for repo_name, workspace in sample_repo_trees.items():
+            steering_dir = workspace / '.kiro' / 'steering'
+            
+            # Check for expected steering files
+            code_style = steering_dir / 'code-style.md'
+            if code_style.exists():
+                content = code_style.read_text(encoding='utf-8')
+                assert len(content.strip()) > 0, f"Empty code-style.md in {repo_name}"
+                assert 'style' in content.lower() or 'code' in content.lower()
     
     def test_sample_repositories_cleanup_properly(self):
         """Test that sample repositories clean up their temporary directories."""
         repositories = get_sample_repositories()
         
         workspaces = []
-        for repo_name, repo in repositories.items():
+        for repo_name, repo_class in repositories.items():
+            repo = repo_class()
             workspace = repo.create()
             workspaces.append(workspace)
             assert workspace.exists(), f"Workspace not created for {repo_name}"
             
             # Clean up
             repo.cleanup()
+            assert repo.workspace is None and repo.temp_dir is None
         
         # Verify all workspaces are cleaned up
         for workspace in workspaces:
             assert not workspace.exists(), f"Workspace not cleaned up: {workspace}"
     
+    def test_cleanup_leaves_caller_provided_directory(self, tmp_path):
+        """Test that cleanup empties a directory passed to create but keeps it."""
+        repo = PythonLibraryRepository()
+        workspace = repo.create(tmp_path)
+        assert workspace == tmp_path
+        assert (workspace / 'README.md').exists()
+        
+        repo.cleanup()
+        
+        assert tmp_path.is_dir()
+        assert list(tmp_path.iterdir()) == []
+        assert repo.workspace is None and repo.temp_dir is None
+    
     def test_sample_repositories_context_manager(self):
         """Test that sample repositories work correctly as context managers."""
         repositories = get_sample_repositories()
         
         workspaces = []
-        for repo_name, repo in repositories.items():
+        for repo_name, repo_class in repositories.items():
+            repo = repo_class()
             with repo as workspace:
                 workspaces.append(workspace)
                 assert workspace.exists(), f"Workspace not created for {repo_name}"
@@ -138,18 +138,13 @@ class TestSampleRepositoryValidation:
         for workspace in workspaces:
             assert not workspace.exists(), f"Workspace not cleaned up: {workspace}"
     
-    def test_sample_repositories_have_different_file_counts(self):
+    def test_sample_repositories_have_different_file_counts(self, sample_repo_trees):
         """Test that different repository types have different numbers of files."""
-        repositories = get_sample_repositories()
-        
         file_counts = {}
-        for repo_name, repo in repositories.items():
-            with repo:
-                workspace = repo.create()
-                
-                # Count all files recursively
-                file_count = len(list(workspace.rglob('*')))
-                file_counts[repo_name] = file_count
+        for repo_name, workspace in sample_repo_trees.items():
+            # Count all files recursively
+            file_count = len(list(workspace.rglob('*')))
+            file_counts[repo_name] = file_count
         
         # Each repository type should have a different number of files
         counts = list(file_counts.values())
@@ -158,4 +153,29 @@ class TestSampleRepositoryValidation:
         # All should have a reasonable number of files
         for repo_name, count in file_counts.items():
             assert count > 10, f"{repo_name} has too few files: {count}"
-            assert count < 100, f"{repo_name} has too many files: {count}"
\ No newline at end of file
+            assert count < 100, f"{repo_name} has too many files: {count}"
+    
+    def test_session_repository_copies_are_isolated(self, python_library_repo, python_library_repo_copy):
+        """Test that copies of the shared repository can be modified independently."""
+        assert python_library_repo_copy != python_library_repo
+        assert (python_library_repo_copy / 'README.md').read_bytes() == (python_library_repo / 'README.md').read_bytes()
+        
+        (python_library_repo_copy / 'README.md').write_text("changed", encoding='utf-8')
+        
+        assert (python_library_repo / 'README.md').read_text(encoding='utf-8') != "changed"
+    
+    def test_create_copy_hard_links_files(self, python_library_repo):
+        """Test that create_copy mirrors an existing tree with hard links."""
+        # Hard links need the copy on the same filesystem as the original
+        repo = PythonLibraryRepository(tmpdir_base=str(python_library_repo.parent))
+        try:
+            workspace = repo.create_copy(python_library_repo)
+            
+            original = sorted(p.relative_to(python_library_repo) for p in python_library_repo.rglob('*'))
+            copied = sorted(p.relative_to(workspace) for p in workspace.rglob('*'))
+            assert copied == original
+            assert (workspace / 'README.md').samefile(python_library_repo / 'README.md')
+        finally:
+            repo.cleanup()
+        
+        assert (python_library_repo / 'README.md').exists()
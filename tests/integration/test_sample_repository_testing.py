@@ -1,26 +1,32 @@
 """Sample repository testing for SpecOps."""
 
 import pytest
+import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch
 import json
 
 from src.main import SpecOpsApp, create_app
 from src.models import AppConfig, RepositoryAnalysis
-from tests.fixtures.sample_repositories import get_sample_repositories
+from tests.fixtures.sample_repositories import reflink_copy
 
 
 class TestSampleRepositoryTesting:
     """Test the system against various repository structures and content types."""
     
     @pytest.fixture(params=['python_library', 'web_application', 'microservice'])
-    def sample_repo(self, request):
-        """Parametrized fixture for different repository types."""
-        repositories = get_sample_repositories()
-        repo = repositories[request.param]
-        workspace = repo.create()
-        yield workspace, request.param
-        repo.cleanup()
+    def sample_repo(self, request, sample_repo_trees, tmp_path):
+        """Parametrized fixture for different repository types.
+        
+        Tests marked ``mutates_files`` get a private copy; all others share the
+        session tree and must not change it.
+        """
+        workspace = sample_repo_trees[request.param]
+        if request.node.get_closest_marker('mutates_files') is not None:
+            copy = tmp_path / 'repo'
+            shutil.copytree(workspace, copy, copy_function=reflink_copy)
+            workspace = copy
+        return workspace, request.param
     
     def test_repository_analysis_across_different_structures(self, sample_repo):
         """Test content analysis works across different repository structures."""
@@ -65,6 +71,7 @@ class TestSampleRepositoryTesting:
             setup_titles = [s.title.lower() for s in analysis.setup_steps]
             assert any('docker' in title or 'kubernetes' in title for title in setup_titles)
     
+    @pytest.mark.mutates_files
     @patch('src.ai.processing_engine.AIProcessingEngine.generate_task_suggestions')
     @patch('src.ai.processing_engine.AIProcessingEngine.create_faq_pairs')
     @patch('src.ai.processing_engine.AIProcessingEngine.extract_quick_start_steps')
@@ -231,6 +238,7 @@ class TestSampleRepositoryTesting:
             # Should find microservice dependencies
             assert any('fastapi' in name or 'prometheus' in name for name in dependency_names)
     
+    @pytest.mark.mutates_files
     def test_error_handling_across_repositories(self, sample_repo):
         """Test error handling works consistently across different repository types."""
         workspace, repo_type = sample_repo
@@ -284,6 +292,7 @@ class TestSampleRepositoryTesting:
             # For larger repositories, should find proportionally more concepts
             assert len(analysis.concepts) >= total_files * 0.1, f"Too few concepts for repository size in {repo_type}"
     
+    @pytest.mark.mutates_files
     def test_output_adherence_to_requirements(self, sample_repo):
         """Verify output quality and adherence to requirements across repository types."""
         workspace, repo_type = sample_repo
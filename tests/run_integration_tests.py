@@ -6,8 +6,9 @@ from pathlib import Path
 import argparse
 
 
-def run_integration_tests(test_pattern: str = None, verbose: bool = False, coverage: bool = False):
-    """Run integration tests with optional filtering and coverage."""
+def run_integration_tests(test_pattern: str = None, verbose: bool = False, coverage: bool = False,
+                          workers: str = None, skip_slow: bool = False):
+    """Run integration tests with optional filtering, coverage and pytest-xdist workers."""
     
     # Base pytest command
     cmd = ["python", "-m", "pytest"]
@@ -20,6 +21,10 @@ def run_integration_tests(test_pattern: str = None, verbose: bool = False, cover
     if test_pattern:
         cmd.extend(["-k", test_pattern])
     
+    # Leave out the slow variants of tests
+    if skip_slow:
+        cmd.extend(["-m", "not slow"])
+    
     # Add verbose flag
     if verbose:
         cmd.append("-v")
@@ -28,6 +33,11 @@ def run_integration_tests(test_pattern: str = None, verbose: bool = False, cover
     if coverage:
         cmd.extend(["--cov=src", "--cov-report=html", "--cov-report=term"])
     
+    # Spread tests over pytest-xdist workers; fixtures build in per-worker tmp dirs
+    # and xdist_group keeps tests sharing a session workspace on one worker
+    if workers:
+        cmd.extend(["-n", workers, "--dist=loadgroup"])
+    
     # Add other useful flags
     cmd.extend([
         "--tb=short",  # Shorter traceback format
@@ -64,6 +74,17 @@ def main():
         help="Run with coverage reporting"
     )
     
+    parser.add_argument(
+        "-n", "--workers",
+        help="Run tests in parallel with pytest-xdist (a number or 'auto')"
+    )
+    
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip tests marked slow"
+    )
+    
     parser.add_argument(
         "--end-to-end",
         action="store_true",
@@ -106,7 +127,9 @@ def main():
     exit_code = run_integration_tests(
         test_pattern=pattern,
         verbose=args.verbose,
-        coverage=args.coverage
+        coverage=args.coverage,
+        workers=args.workers,
+        skip_slow=args.fast
     )
     
     # Print summary
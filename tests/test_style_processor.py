@@ -1,5 +1,6 @@
 """Tests for style processing and compliance system."""
 
+import io
 import pytest
 import tempfile
 from pathlib import Path
@@ -112,6 +113,7 @@ class TestStyleProcessor:
         processor = StyleProcessor()
         
         assert isinstance(processor.style_config, StyleConfig)
+        assert processor._config_version == 0
         assert processor._code_rules_cache is None
         assert processor._structure_rules_cache is None
         assert processor._onboarding_rules_cache is None
@@ -129,10 +131,22 @@ class TestStyleProcessor:
             self.processor.load_steering_guidelines()
             
             mock_load.assert_called_once()
-            # Caches should be cleared
-            assert self.processor._code_rules_cache is None
-            assert self.processor._structure_rules_cache is None
-            assert self.processor._onboarding_rules_cache is None
+            # Config version should be bumped so caches are re-parsed lazily
+            assert self.processor._config_version == 1
+    
+    def test_load_steering_guidelines_invalidates_cached_rules(self):
+        """Test that reloading guidelines re-parses rules on next access."""
+        first = self.processor.get_code_style_rules()
+        assert self.processor.get_code_style_rules() is first
+        
+        with patch.object(self.processor.style_config, 'load_content'):
+            self.processor.load_steering_guidelines()
+        
+        with patch.object(self.processor.style_config, 'get_code_style_rules',
+                          return_value=["reloaded"]) as mock_rules:
+            assert self.processor.get_code_style_rules() == ["reloaded"]
+            assert self.processor.get_code_style_rules() == ["reloaded"]
+            mock_rules.assert_called_once()
     
     def test_get_code_style_rules(self):
         """Test getting code style rules."""
@@ -149,7 +163,7 @@ class TestStyleProcessor:
         
         assert rules == expected_rules
         # Should cache the result
-        assert self.processor._code_rules_cache == expected_rules
+        assert self.processor._code_rules_cache == (0, expected_rules)
     
     def test_get_structure_rules(self):
         """Test getting structure rules."""
@@ -164,7 +178,7 @@ class TestStyleProcessor:
         ]
         
         assert rules == expected_rules
-        assert self.processor._structure_rules_cache == expected_rules
+        assert self.processor._structure_rules_cache == (0, expected_rules)
     
     def test_get_onboarding_rules(self):
         """Test getting onboarding style rules."""
@@ -179,7 +193,7 @@ class TestStyleProcessor:
         ]
         
         assert rules == expected_rules
-        assert self.processor._onboarding_rules_cache == expected_rules
+        assert self.processor._onboarding_rules_cache == (0, expected_rules)
 
 
 class TestCodeStyleValidation:
@@ -483,6 +497,14 @@ This is **important** information.
         violations = [v for v in result.violations if v.rule == "highlight_important"]
         assert len(violations) == 0
 
+    def test_validate_onboarding_style_highlight_whole_words_only(self):
+        """Test highlighting ignores words that merely contain a keyword."""
+        content = "Open the notebook.\nWARNING: back up first."
+
+        result = self.processor.validate_onboarding_style(content, "markdown")
+
+        assert result.corrected_content == "Open the notebook.\n**WARNING**: back up first."
+
 
 class TestStyleCorrections:
     """Test automatic style corrections."""
@@ -609,6 +631,64 @@ Welcome to our project! Here are the **important** steps:
         assert len(result.violations) == 0
         assert result.corrected_content is None
 
+    def test_validate_all_styles_memoizes_structure_result(self):
+        """Test structure validation runs once per file path."""
+        with patch.object(self.processor, 'validate_structure_compliance',
+                          wraps=self.processor.validate_structure_compliance) as mock_structure:
+            first = self.processor.validate_all_styles("x = 1\n", "python", "utils/helper.py")
+            second = self.processor.validate_all_styles("y = 2\n", "python", "utils/helper.py")
+
+            mock_structure.assert_called_once_with("utils/helper.py")
+
+        assert [v.rule for v in first.violations] == [v.rule for v in second.violations]
+
+    def test_validate_all_styles_matches_individual_validators(self):
+        """Test the single-pass validation agrees with the per-guideline validators."""
+        content = '''- [ ] setup the project
+- [ ] 1. Install dependencies
+This is important, obviously.
+'''
+
+        combined = self.processor.validate_all_styles(content, "tasks")
+        onboarding = self.processor.validate_onboarding_style(content, "tasks")
+
+        assert [(v.rule, v.line_number) for v in combined.violations] == \
+            [(v.rule, v.line_number) for v in onboarding.violations]
+        assert combined.corrected_content == onboarding.corrected_content
+
+    def test_validate_python_buffer_matches_text_validation(self):
+        """Test byte-level validation agrees with validating decoded text."""
+        code = '''def HelloWorld():
+    return "Hello, World!"
+
+class myClass:
+    """Docstring."""
+# Ünïcödé comment that is long enough to pass the limit in bytes but not in chars
+''' + "x" * 95 + "\r\n"
+
+        expected = self.processor.validate_all_styles(
+            code.replace("\r\n", "\n"), "python", "src/pkg/module.py"
+        )
+        result = self.processor.validate_python_buffer(
+            io.BytesIO(code.encode("utf-8")), "src/pkg/module.py"
+        )
+
+        assert result.violations == expected.violations
+        assert result.is_compliant == expected.is_compliant
+        assert result.corrected_content is None
+
+    def test_validate_python_buffer_repeated_calls_do_not_grow_cache(self):
+        """Test repeated byte-level validation of one path reports the same violations."""
+        code = b'def HelloWorld():\n    return 1\n'
+
+        first = self.processor.validate_python_buffer(io.BytesIO(code), "src/pkg/module.py")
+        second = self.processor.validate_python_buffer(io.BytesIO(code), "src/pkg/module.py")
+        text = self.processor.validate_all_styles(code.decode(), "python", "src/pkg/module.py")
+
+        assert first.violations is not second.violations
+        assert len(first.violations) == len(second.violations)
+        assert second.violations == text.violations
+
 
 class TestStyleSummaryAndReporting:
     """Test style summary and reporting functionality."""